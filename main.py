@@ -1,69 +1,67 @@
+import math
 import streamlit as st
 import numpy as np
+import altair as alt
 import pandas as pd
-import matplotlib.pyplot as plt
-import numpy_financial as npf
+from numba import njit, prange
 
+# One record per simulated month
+SIMULATION_DTYPE = np.dtype([
+    ("months", np.float64),
+    ("cumulative_cash_flow", np.float64),
+    ("structure_values", np.float64),
+    ("land_values", np.float64),
+    ("alt_values", np.float64),
+    ("monthly_net_cash_flow", np.float64),
+    ("monthly_rental_income", np.float64),
+])
+
+def check_land_value(house_price, land_value):
+    """
+    Raise a ValueError if the house price does not cover the land value.
+    """
+    if house_price < land_value:
+        raise ValueError("House price is less than calculated land value. Please check your inputs.")
+
+@njit(cache=True)
 def calculate_emi(P, annual_interest_rate, years):
     """
     Calculate the fixed monthly EMI for a loan.
     """
-    monthly_rate = annual_interest_rate / 100 / 12
+    monthly_rate = annual_interest_rate / 1200.0
     n = years * 12
-    EMI = P * monthly_rate * (1 + monthly_rate)**n / ((1 + monthly_rate)**n - 1)
+    if abs(monthly_rate) < 1e-9:
+        return P / n
+    # (1 + r)**n - 1 via expm1/log1p stays accurate when the rate is close to zero
+    growth_minus_one = math.expm1(n * math.log1p(monthly_rate))
+    EMI = P * monthly_rate * (growth_minus_one + 1.0) / growth_minus_one
     return EMI
 
-def simulate_investment(params):
+@njit(cache=True, fastmath=True)
+def _simulate_core(house_price, loan_interest, loan_term, monthly_rent, rental_increase,
+                   house_depreciation_rate, initial_land_value, land_growth_rate, alternative_return,
+                   property_tax_rate, insurance_rate, management_fee_rate, maintenance_rate,
+                   vacancy_rate, alt_investment_tax,
+                   months, cumulative_cash_flow, structure_values, land_values,
+                   alt_values, monthly_net_cash_flow, monthly_rental_income):
     """
-    Run a monthly simulation of cash flows and property value evolution.
-    The property is broken into a depreciating structure and an appreciating land component.
-    Returns a dictionary with arrays of monthly metrics.
+    Compiled monthly simulation loop. Writes into the pre-allocated output arrays
+    and returns the monthly EMI.
     """
-    # Basic parameters
-    house_price = params['house_price']
-    loan_interest = params['loan_interest']
-    loan_term = params['loan_term']
-    monthly_rent = params['monthly_rent']
-    rental_increase = params['rental_increase']
-    house_depreciation_rate = params['house_depreciation_rate']
-    land_area = params['land_area']
-    land_price_per_sqft = params['land_price_per_sqft']
-    land_growth_rate = params['land_growth_rate']
-    alternative_return = params['alternative_return']
-    inflation_rate = params['inflation_rate']
-    
-    # Advanced parameters (all default to 0 if not changed)
-    property_tax_rate = params['property_tax_rate']
-    insurance_rate = params['insurance_rate']
-    management_fee_rate = params['management_fee_rate']
-    maintenance_rate = params['maintenance_rate']
-    vacancy_rate = params['vacancy_rate']
-    alt_investment_tax = params['alt_investment_tax']
-    
-    n = int(loan_term * 12)
+    n = months.shape[0]
     EMI = calculate_emi(house_price, loan_interest, loan_term)
     
-    # Calculate initial values for land and structure.
-    initial_land_value = land_area * land_price_per_sqft
-    structure_value_initial = house_price - initial_land_value
-    if structure_value_initial < 0:
-        raise ValueError("House price is less than calculated land value. Please check your inputs.")
-    
-    # Initialize arrays for simulation results
-    months = np.arange(1, n + 1)
-    cumulative_cash_flow = np.zeros(n)
-    structure_values = np.zeros(n)
-    land_values = np.zeros(n)
-    total_property_values = np.zeros(n)
-    alt_values = np.zeros(n)
-    monthly_net_cash_flow = np.zeros(n)
-    monthly_rental_income = np.zeros(n)
+    # Rental income increases at the beginning of each year; build the monthly series up front
+    years = (n + 11) // 12
+    yearly_growth = np.full(years, 1 + rental_increase / 100)
+    yearly_growth[0] = 1.0
+    rent_series = np.repeat(monthly_rent * np.cumprod(yearly_growth), 12)
     
     # Starting values
-    current_rent = monthly_rent
-    structure_value = structure_value_initial
+    structure_value = house_price - initial_land_value
     land_value = initial_land_value
     alt_value = house_price  # Initial alternative investment capital
+    cumulative = 0.0
     
     # Monthly factors for depreciation/appreciation and alternative growth
     structure_factor = (1 - house_depreciation_rate / 100) ** (1 / 12)
@@ -76,10 +74,9 @@ def simulate_investment(params):
     maintenance_monthly = (maintenance_rate / 100 * house_price) / 12
 
     for m in range(n):
-        # Increase rental income at the beginning of each year
-        if m > 0 and m % 12 == 0:
-            current_rent *= (1 + rental_increase / 100)
-        rental_income_effective = current_rent * (1 - vacancy_rate / 100)
+        months[m] = m + 1
+        
+        rental_income_effective = rent_series[m] * (1 - vacancy_rate / 100)
         monthly_rental_income[m] = rental_income_effective
         
         # Calculate management fee on rental income
@@ -88,128 +85,327 @@ def simulate_investment(params):
         # Net income for the month: effective rent minus EMI and expenses
         net_income = rental_income_effective - EMI - property_tax_monthly - insurance_monthly - management_fee - maintenance_monthly
         monthly_net_cash_flow[m] = net_income
-        cumulative_cash_flow[m] = net_income if m == 0 else cumulative_cash_flow[m - 1] + net_income
+        cumulative += net_income
+        cumulative_cash_flow[m] = cumulative
         
         # Update property values: structure depreciates, land appreciates
         structure_value *= structure_factor
         land_value *= land_factor
-        total_value = structure_value + land_value
-        
         structure_values[m] = structure_value
         land_values[m] = land_value
-        total_property_values[m] = total_value
         
         # Alternative investment grows monthly
         alt_value *= (1 + monthly_alt_rate)
         alt_values[m] = alt_value
 
     # Apply alternative investment tax on final value
-    final_alt_value = alt_values[-1] * (1 - alt_investment_tax / 100)
-    alt_values[-1] = final_alt_value
+    alt_values[n - 1] = alt_value * (1 - alt_investment_tax / 100)
+    return EMI
+
+@st.cache_data(show_spinner=False)
+def simulate_investment(params):
+    """
+    Run a monthly simulation of cash flows and property value evolution.
+    The property is broken into a depreciating structure and an appreciating land component.
+    Returns a dictionary with a structured array of monthly metrics (see SIMULATION_DTYPE) and the EMI.
+    """
+    # Basic parameters
+    house_price = params['house_price']
+    loan_interest = params['loan_interest']
+    loan_term = params['loan_term']
+    monthly_rent = params['monthly_rent']
+    rental_increase = params['rental_increase']
+    house_depreciation_rate = params['house_depreciation_rate']
+    land_area = params['land_area']
+    land_price_per_sqft = params['land_price_per_sqft']
+    land_growth_rate = params['land_growth_rate']
+    alternative_return = params['alternative_return']
+    inflation_rate = params['inflation_rate']
+    
+    # Advanced parameters (all default to 0 if not changed)
+    property_tax_rate = params['property_tax_rate']
+    insurance_rate = params['insurance_rate']
+    management_fee_rate = params['management_fee_rate']
+    maintenance_rate = params['maintenance_rate']
+    vacancy_rate = params['vacancy_rate']
+    alt_investment_tax = params['alt_investment_tax']
+    
+    n = int(loan_term * 12)
+    
+    # Calculate initial values for land and structure.
+    initial_land_value = land_area * land_price_per_sqft
+    check_land_value(house_price, initial_land_value)
+    
+    # Single structured buffer for all simulation results; each field is filled in place by the compiled loop
+    records = np.empty(n, dtype=SIMULATION_DTYPE)
+    
+    EMI = _simulate_core(float(house_price), float(loan_interest), float(loan_term), float(monthly_rent),
+                         float(rental_increase), float(house_depreciation_rate), float(initial_land_value),
+                         float(land_growth_rate), float(alternative_return), float(property_tax_rate),
+                         float(insurance_rate), float(management_fee_rate), float(maintenance_rate),
+                         float(vacancy_rate), float(alt_investment_tax),
+                         records["months"], records["cumulative_cash_flow"], records["structure_values"],
+                         records["land_values"], records["alt_values"], records["monthly_net_cash_flow"],
+                         records["monthly_rental_income"])
 
     results = {
-        "months": months,
-        "cumulative_cash_flow": cumulative_cash_flow,
-        "structure_values": structure_values,
-        "land_values": land_values,
-        "total_property_values": total_property_values,
-        "alt_values": alt_values,
-        "monthly_net_cash_flow": monthly_net_cash_flow,
-        "monthly_rental_income": monthly_rental_income,
+        "records": records,
         "EMI": EMI
     }
     return results
 
+@njit(parallel=True, cache=True)
+def simulate_batch(house_prices, loan_interests, loan_terms, monthly_rents, rental_increases,
+                   house_depreciation_rates, initial_land_values, land_growth_rates, alternative_returns,
+                   property_tax_rates, insurance_rates, management_fee_rates, maintenance_rates,
+                   vacancy_rates, alt_investment_taxes):
+    """
+    Run many independent scenarios in parallel. Every argument is an array with one entry per scenario.
+    Returns the final Total Property Benefit minus the final Alternative Investment Value for each
+    scenario (NaN where the house price is below the land value).
+    """
+    n_scenarios = house_prices.shape[0]
+    differences = np.empty(n_scenarios)
+    for i in prange(n_scenarios):
+        if house_prices[i] < initial_land_values[i]:
+            differences[i] = np.nan
+            continue
+        n = int(loan_terms[i] * 12)
+        buf = np.empty((7, n))
+        _simulate_core(house_prices[i], loan_interests[i], loan_terms[i], monthly_rents[i], rental_increases[i],
+                       house_depreciation_rates[i], initial_land_values[i], land_growth_rates[i],
+                       alternative_returns[i], property_tax_rates[i], insurance_rates[i],
+                       management_fee_rates[i], maintenance_rates[i], vacancy_rates[i], alt_investment_taxes[i],
+                       buf[0], buf[1], buf[2], buf[3], buf[4], buf[5], buf[6])
+        # Structure + land value + cumulative cash flow - alternative investment value
+        differences[i] = buf[2, n - 1] + buf[3, n - 1] + buf[1, n - 1] - buf[4, n - 1]
+    return differences
+
+@st.cache_data(show_spinner=False)
+def simulate_sensitivity(params, loan_interests, alternative_returns):
+    """
+    Sweep loan interest and alternative return rates, keeping all other parameters fixed.
+    params must not contain 'loan_interest' or 'alternative_return', so that changing those
+    sidebar inputs does not invalidate the cached sweep.
+    Returns a 2D array (alternative return x loan interest) of final property benefit minus
+    final alternative investment value.
+    """
+    interest_grid, alt_grid = np.meshgrid(loan_interests, alternative_returns)
+    size = interest_grid.size
+
+    def full(value):
+        return np.full(size, float(value))
+
+    differences = simulate_batch(
+        full(params['house_price']), interest_grid.ravel().astype(np.float64), full(params['loan_term']),
+        full(params['monthly_rent']), full(params['rental_increase']), full(params['house_depreciation_rate']),
+        full(params['land_area'] * params['land_price_per_sqft']), full(params['land_growth_rate']),
+        alt_grid.ravel().astype(np.float64), full(params['property_tax_rate']), full(params['insurance_rate']),
+        full(params['management_fee_rate']), full(params['maintenance_rate']), full(params['vacancy_rate']),
+        full(params['alt_investment_tax']))
+    return differences.reshape(interest_grid.shape)
+
+@st.cache_data(show_spinner=False)
 def generate_yearly_report(results, loan_term, currency):
     """
     Generate a year-by-year DataFrame report from monthly simulation data.
     """
-    n = int(loan_term * 12)
     years = np.arange(1, loan_term + 1)
-    year_end_indices = [(y * 12 - 1) for y in years]
     
+    # Year-end months sit at a fixed stride of 12, so a strided slice of the records is a view without copying
+    year_end = results["records"][11::12]
     df = pd.DataFrame({
         "Year": years,
-        f"Structure Value ({currency})": results["structure_values"][year_end_indices],
-        f"Land Value ({currency})": results["land_values"][year_end_indices],
-        f"Total Property Value ({currency})": results["total_property_values"][year_end_indices],
-        f"Cumulative Cash Flow ({currency})": results["cumulative_cash_flow"][year_end_indices],
-        f"Alternative Investment Value ({currency})": results["alt_values"][year_end_indices],
+        f"Structure Value ({currency})": year_end["structure_values"],
+        f"Land Value ({currency})": year_end["land_values"],
+        f"Total Property Value ({currency})": year_end["structure_values"] + year_end["land_values"],
+        f"Cumulative Cash Flow ({currency})": year_end["cumulative_cash_flow"],
+        f"Alternative Investment Value ({currency})": year_end["alt_values"],
     })
     df[f"Total Property Benefit ({currency})"] = df[f"Total Property Value ({currency})"] + df[f"Cumulative Cash Flow ({currency})"]
     df[f"Difference (Property Benefit - Alt) ({currency})"] = df[f"Total Property Benefit ({currency})"] - df[f"Alternative Investment Value ({currency})"]
     df["% Difference"] = (df[f"Difference (Property Benefit - Alt) ({currency})"] / df[f"Alternative Investment Value ({currency})"]) * 100
     return df
 
+def _discounted_sum(cash_flows, rate):
+    """
+    Evaluate sum(cf[t] / (1 + rate)**t) for t = 0..n-1 with Horner's method.
+    """
+    v = 1.0 / (1.0 + rate)
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        return np.polyval(cash_flows[::-1], v)
+
+def _scaled_npv(cash_flows, rate):
+    """
+    NPV at the given rate(s), rescaled by a positive factor so it stays finite for any rate > -1.
+    For rates below zero the series is multiplied by (1 + rate)**(n - 1), which keeps the sign
+    (and therefore the roots) of the NPV while avoiding overflow.
+    """
+    rate = np.asarray(rate, dtype=np.float64)
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        return np.where(rate >= 0, _discounted_sum(cash_flows, rate), np.polyval(cash_flows, 1.0 + rate))
+
+def _irr(cash_flows, tol=1e-12, maxiter=200):
+    """
+    Find the per-period IRR of a cash-flow series.
+    Sign changes of NPV are located on a grid of rates above -1 and each one is refined with the
+    Illinois (bracketed regula falsi) method. As with numpy_financial.irr, the root closest to zero
+    is returned, or np.nan if there is none.
+    """
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
+    scale = np.sum(np.abs(cash_flows))
+    if scale == 0:
+        return np.nan
+
+    def npv(r):
+        return float(_scaled_npv(cash_flows, r))
+
+    # Grid is uniform in log(1 + r): fine near zero, reaching from about -99.3% to +14,700% per period
+    grid = np.expm1(np.linspace(-5.0, 5.0, 2001))
+    values = _scaled_npv(cash_flows, grid)
+    roots = list(grid[values == 0])
+    for i in np.nonzero(values[:-1] * values[1:] < 0)[0]:
+        a, b, fa, fb = grid[i], grid[i + 1], values[i], values[i + 1]
+        side = 0
+        for _ in range(maxiter):
+            c = (a * fb - b * fa) / (fb - fa)
+            fc = npv(c)
+            if fc == 0 or abs(b - a) <= tol * (1 + abs(c)):
+                break
+            if fc * fb > 0:
+                b, fb = c, fc
+                if side == -1:
+                    fa /= 2
+                side = -1
+            else:
+                a, fa = c, fc
+                if side == 1:
+                    fb /= 2
+                side = 1
+        # Only accept a point where NPV has actually vanished, not just where the steps became small
+        if abs(fc) <= 1e-9 * scale:
+            roots.append(c)
+    if not roots:
+        return np.nan
+    return min(roots, key=abs)
+
+@st.cache_data(show_spinner=False)
 def calculate_advanced_metrics(cash_flows, discount_rate):
     """
     Calculate advanced financial metrics: NPV and IRR.
     cash_flows: array of monthly cash flows.
     discount_rate: annual discount rate (percent).
     """
-    n = len(cash_flows)
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
     monthly_discount_rate = discount_rate / 100 / 12
-    months = np.arange(1, n + 1)
-    npv = np.sum(cash_flows / ((1 + monthly_discount_rate) ** months))
+    # Cash flows are discounted from month 1, hence the extra factor of 1 / (1 + r)
+    npv = _discounted_sum(cash_flows, monthly_discount_rate) / (1 + monthly_discount_rate)
     
-    irr_monthly = npf.irr(cash_flows)
-    irr_annual = (1 + irr_monthly)**12 - 1 if irr_monthly is not None else None
+    irr_monthly = _irr(cash_flows)
+    irr_annual = (1 + irr_monthly)**12 - 1 if np.isfinite(irr_monthly) else None
     return npv, irr_annual
 
 def plot_results(results, df_report, currency):
     """
-    Plot various graphs for visual analysis.
-    Returns a tuple of figures.
+    Render various graphs for visual analysis.
+    Charts are drawn client-side with st.line_chart rather than rasterized on the server.
     """
-    n = len(results["months"])
+    records = results["records"]
+    years = records["months"] / 12
     
     # Graph 1: Yearly comparison of Total Property Value vs Alternative Investment
-    fig1, ax1 = plt.subplots(figsize=(10, 6))
-    ax1.plot(df_report["Year"], df_report[f"Total Property Value ({currency})"], label="Total Property Value", marker='o')
-    ax1.plot(df_report["Year"], df_report[f"Alternative Investment Value ({currency})"], label="Alternative Investment Value", marker='o', linestyle="--")
-    ax1.set_xlabel("Year")
-    ax1.set_ylabel(f"Value ({currency})")
-    ax1.set_title("Yearly Comparison: Property vs Alternative Investment")
-    ax1.legend()
-    ax1.grid(True)
+    st.markdown("**Yearly Comparison: Property vs Alternative Investment**")
+    st.line_chart(pd.DataFrame({
+        "Year": df_report["Year"],
+        "Total Property Value": df_report[f"Total Property Value ({currency})"],
+        "Alternative Investment Value": df_report[f"Alternative Investment Value ({currency})"],
+    }).set_index("Year"), x_label="Year", y_label=f"Value ({currency})")
     
     # Graph 2: Cumulative Cash Flow over time
-    fig2, ax2 = plt.subplots(figsize=(10, 6))
-    ax2.plot(results["months"] / 12, results["cumulative_cash_flow"], label="Cumulative Cash Flow", color="purple")
-    ax2.set_xlabel("Years")
-    ax2.set_ylabel(f"Cumulative Cash Flow ({currency})")
-    ax2.set_title("Cumulative Cash Flow Over Time")
-    ax2.legend()
-    ax2.grid(True)
+    st.markdown("**Cumulative Cash Flow Over Time**")
+    st.line_chart(pd.DataFrame({
+        "Years": years,
+        "Cumulative Cash Flow": records["cumulative_cash_flow"],
+    }).set_index("Years"), x_label="Years", y_label=f"Cumulative Cash Flow ({currency})", color="#800080")
     
     # Graph 3: Monthly Rental Income vs Net Cash Flow
-    fig3, ax3 = plt.subplots(figsize=(10, 6))
-    ax3.plot(results["months"] / 12, results["monthly_rental_income"], label="Monthly Rental Income", color="green")
-    ax3.plot(results["months"] / 12, results["monthly_net_cash_flow"], label="Monthly Net Cash Flow", color="red")
-    ax3.set_xlabel("Years")
-    ax3.set_ylabel(f"Amount ({currency})")
-    ax3.set_title("Monthly Rental Income vs Net Cash Flow")
-    ax3.legend()
-    ax3.grid(True)
+    st.markdown("**Monthly Rental Income vs Net Cash Flow**")
+    st.line_chart(pd.DataFrame({
+        "Years": years,
+        "Monthly Rental Income": records["monthly_rental_income"],
+        "Monthly Net Cash Flow": records["monthly_net_cash_flow"],
+    }).set_index("Years"), x_label="Years", y_label=f"Amount ({currency})", color=["#008000", "#ff0000"])
     
     # Graph 4: Yearly % Difference between Property Benefit and Alternative Investment
-    fig4, ax4 = plt.subplots(figsize=(10, 6))
-    ax4.plot(df_report["Year"], df_report["% Difference"], label="% Difference", color="orange", marker='o')
-    ax4.set_xlabel("Year")
-    ax4.set_ylabel("% Difference")
-    ax4.set_title("Yearly % Difference: (Property Benefit - Alternative) / Alternative")
-    ax4.legend()
-    ax4.grid(True)
-    
-    return fig1, fig2, fig3, fig4
+    st.markdown("**Yearly % Difference: (Property Benefit - Alternative) / Alternative**")
+    st.line_chart(pd.DataFrame({
+        "Year": df_report["Year"],
+        "% Difference": df_report["% Difference"],
+    }).set_index("Year"), x_label="Year", y_label="% Difference", color="#ffa500")
+
+def sensitivity_analysis(params, currency):
+    """
+    Render the sensitivity analysis page: a heatmap of the final outcome over a grid of
+    loan interest and alternative return rates.
+    """
+    st.subheader("Sensitivity Analysis")
+    st.markdown("""
+    Explore how the outcome changes with the loan interest rate and the alternative investment return.
+    All other inputs are taken from the sidebar. Positive values mean buying the house comes out ahead.
+    """)
+    
+    with st.form("sensitivity_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            interest_min = st.number_input("Loan Interest From (%)", value=4.0, step=0.5)
+            interest_max = st.number_input("Loan Interest To (%)", value=10.0, step=0.5)
+            interest_steps = st.number_input("Loan Interest Steps", value=13, min_value=2, step=1)
+        with col2:
+            alt_min = st.number_input("Alternative Return From (%)", value=2.0, step=0.5)
+            alt_max = st.number_input("Alternative Return To (%)", value=12.0, step=0.5)
+            alt_steps = st.number_input("Alternative Return Steps", value=11, min_value=2, step=1)
+        submitted = st.form_submit_button("Run Sensitivity Analysis")
+    
+    # Remember the submitted ranges so the heatmap survives later reruns; the sweep itself is
+    # cached, so recomputing it here also picks up any change to the sidebar parameters.
+    if submitted:
+        st.session_state["sensitivity_ranges"] = (
+            np.linspace(interest_min, interest_max, int(interest_steps)),
+            np.linspace(alt_min, alt_max, int(alt_steps)),
+        )
+    if "sensitivity_ranges" not in st.session_state:
+        return
+    loan_interests, alternative_returns = st.session_state["sensitivity_ranges"]
+    
+    try:
+        check_land_value(params['house_price'], params['land_area'] * params['land_price_per_sqft'])
+    except ValueError as e:
+        st.error(str(e))
+        return
+    
+    # The swept parameters are left out of the cache key; the grid overrides them anyway
+    sweep_params = {k: v for k, v in params.items() if k not in ('loan_interest', 'alternative_return')}
+    differences = simulate_sensitivity(sweep_params, loan_interests, alternative_returns)
+    
+    interest_grid, alt_grid = np.meshgrid(loan_interests, alternative_returns)
+    df_grid = pd.DataFrame({
+        "Loan Interest (%)": np.round(interest_grid.ravel(), 2),
+        "Alternative Return (%)": np.round(alt_grid.ravel(), 2),
+        "Difference": differences.ravel(),
+    })
+    heatmap = alt.Chart(df_grid).mark_rect().encode(
+        x=alt.X("Loan Interest (%):O"),
+        y=alt.Y("Alternative Return (%):O", sort="descending"),
+        color=alt.Color("Difference:Q", title=f"Property Benefit - Alt ({currency})",
+                        scale=alt.Scale(scheme="redyellowgreen", domainMid=0)),
+        tooltip=["Loan Interest (%)", "Alternative Return (%)", alt.Tooltip("Difference:Q", format=",.2f")],
+    ).properties(title="Final Property Benefit - Alternative Investment Value")
+    st.altair_chart(heatmap, use_container_width=True)
 
 def main():
     st.title("House Investment Analysis Calculator")
     
-    st.markdown("""
-    This tool compares buying a house (with structure and land) using a loan versus an alternative investment.
-    The report below will show you which investment appears better and provide a structured, year-by-year analysis.
-    """)
+    page = st.sidebar.radio("Page", ["Investment Report", "Sensitivity Analysis"])
     
     st.sidebar.header("Input Parameters")
     
@@ -241,29 +437,38 @@ def main():
         vacancy_rate = st.number_input("Vacancy Rate (%)", value=0.0, step=0.1)
         alt_investment_tax = st.number_input("Alternative Investment Tax (%)", value=0.0, step=0.1)
     
+    params = {
+        'house_price': house_price,
+        'loan_interest': loan_interest,
+        'loan_term': loan_term,
+        'monthly_rent': monthly_rent,
+        'rental_increase': rental_increase,
+        'house_depreciation_rate': house_depreciation_rate,
+        'land_area': land_area,
+        'land_price_per_sqft': land_price_per_sqft,
+        'land_growth_rate': land_growth_rate,
+        'alternative_return': alternative_return,
+        'inflation_rate': inflation_rate,
+        'property_tax_rate': property_tax_rate,
+        'insurance_rate': insurance_rate,
+        'management_fee_rate': management_fee_rate,
+        'maintenance_rate': maintenance_rate,
+        'vacancy_rate': vacancy_rate,
+        'alt_investment_tax': alt_investment_tax
+    }
+    
+    if page == "Sensitivity Analysis":
+        sensitivity_analysis(params, currency)
+        return
+    
+    st.markdown("""
+    This tool compares buying a house (with structure and land) using a loan versus an alternative investment.
+    The report below will show you which investment appears better and provide a structured, year-by-year analysis.
+    """)
+    
     run_simulation = st.sidebar.button("Generate Report")
     
     if run_simulation:
-        params = {
-            'house_price': house_price,
-            'loan_interest': loan_interest,
-            'loan_term': loan_term,
-            'monthly_rent': monthly_rent,
-            'rental_increase': rental_increase,
-            'house_depreciation_rate': house_depreciation_rate,
-            'land_area': land_area,
-            'land_price_per_sqft': land_price_per_sqft,
-            'land_growth_rate': land_growth_rate,
-            'alternative_return': alternative_return,
-            'inflation_rate': inflation_rate,
-            'property_tax_rate': property_tax_rate,
-            'insurance_rate': insurance_rate,
-            'management_fee_rate': management_fee_rate,
-            'maintenance_rate': maintenance_rate,
-            'vacancy_rate': vacancy_rate,
-            'alt_investment_tax': alt_investment_tax
-        }
-        
         try:
             results = simulate_investment(params)
         except ValueError as e:
@@ -275,11 +480,12 @@ def main():
         # Summary figures
         n = int(loan_term * 12)
         EMI = results["EMI"]
-        final_structure_value = results["structure_values"][-1]
-        final_land_value = results["land_values"][-1]
-        final_total_property_value = results["total_property_values"][-1]
-        final_cumulative_cash_flow = results["cumulative_cash_flow"][-1]
-        final_alt_value = results["alt_values"][-1]
+        records = results["records"]
+        final_structure_value = records["structure_values"][-1]
+        final_land_value = records["land_values"][-1]
+        final_total_property_value = final_structure_value + final_land_value
+        final_cumulative_cash_flow = records["cumulative_cash_flow"][-1]
+        final_alt_value = records["alt_values"][-1]
         final_total_property_benefit = final_total_property_value + final_cumulative_cash_flow
         
         st.subheader("Summary Report")
@@ -299,7 +505,7 @@ def main():
             st.error("**Investment Analysis:** Investing the money elsewhere appears to be the better option.")
         
         # Calculate advanced metrics
-        npv, irr_annual = calculate_advanced_metrics(results["monthly_net_cash_flow"], discount_rate)
+        npv, irr_annual = calculate_advanced_metrics(records["monthly_net_cash_flow"], discount_rate)
         st.write(f"**NPV of Cash Flows (using {discount_rate}% discount rate):** {currency}{npv:,.2f}")
         if irr_annual is not None:
             st.write(f"**IRR (Annualized):** {irr_annual * 100:.2f}%")
@@ -308,23 +514,17 @@ def main():
         
         # Display Yearly Report Table
         st.subheader("Yearly Investment Report")
-        st.dataframe(df_report.style.format({
-            f"Structure Value ({currency})": "{:,.2f}",
-            f"Land Value ({currency})": "{:,.2f}",
-            f"Total Property Value ({currency})": "{:,.2f}",
-            f"Cumulative Cash Flow ({currency})": "{:,.2f}",
-            f"Alternative Investment Value ({currency})": "{:,.2f}",
-            f"Total Property Benefit ({currency})": "{:,.2f}",
-            f"Difference (Property Benefit - Alt) ({currency})": "{:,.2f}",
-            "% Difference": "{:.2f}%"
-        }))
+        # Format each column once with vectorized map instead of running the per-cell Styler pipeline
+        df_display = df_report.copy()
+        for col in df_display.columns:
+            if col == "% Difference":
+                df_display[col] = df_display[col].map("{:.2f}%".format)
+            elif col != "Year":
+                df_display[col] = df_display[col].map("{:,.2f}".format)
+        st.dataframe(df_display)
         
         # Generate and display graphs
-        fig1, fig2, fig3, fig4 = plot_results(results, df_report, currency)
-        st.pyplot(fig1)
-        st.pyplot(fig2)
-        st.pyplot(fig3)
-        st.pyplot(fig4)
+        plot_results(results, df_report, currency)
         
         st.markdown("### Analysis and Discussion")
         st.markdown(f"""